@@ -1,5 +1,10 @@
 """Core ChemShell calculations module."""
 
+from collections.abc import Callable, Iterable
+from functools import lru_cache, wraps
+from types import UnionType
+from typing import ClassVar, get_args, get_origin
+
 from aiida.common import CalcInfo, CodeInfo
 from aiida.common.folders import Folder
 from aiida.engine import CalcJob, CalcJobProcessSpec, PortNamespace
@@ -14,7 +19,195 @@ from aiida.orm import (
 )
 
 from aiida_chemshell.units import UnitsConverter
-from aiida_chemshell.utils import ChemShellMMTheory, ChemShellQMTheory
+from aiida_chemshell.utils import (
+    ChemShellMMTheory,
+    ChemShellQMTheory,
+    generate_parameter_string,
+)
+
+# ChemShell class names for each of the supported theory interfaces
+_QM_THEORY_KEYS = {
+    ChemShellQMTheory.CASTEP: "CASTEP",
+    ChemShellQMTheory.CP2K: "CP2K",
+    ChemShellQMTheory.DFTBP: "DFTBplus",
+    ChemShellQMTheory.FHI_AIMS: "FHIaims",
+    ChemShellQMTheory.GAMESS_UK: "GAMESS_UK",
+    ChemShellQMTheory.GAUSSIAN: "Gaussian",
+    ChemShellQMTheory.LSDALTON: "LSDalton",
+    ChemShellQMTheory.MNDO: "MNDO",
+    ChemShellQMTheory.MOLPRO: "Molpro",
+    ChemShellQMTheory.NWCHEM: "NWChem",
+    ChemShellQMTheory.ORCA: "ORCA",
+    ChemShellQMTheory.PYSCF: "PySCF",
+    ChemShellQMTheory.TURBOMOLE: "TURBOMOLE",
+}
+_MM_THEORY_KEYS = {
+    ChemShellMMTheory.DL_POLY: "DL_POLY",
+    ChemShellMMTheory.GULP: "GULP",
+    ChemShellMMTheory.NAMD: "NAMD",
+}
+# Script import lines for each of the supported theory interfaces
+_QM_IMPORT_LINES = {
+    theory: f"from chemsh import {key:s}\n" for theory, key in _QM_THEORY_KEYS.items()
+}
+_MM_IMPORT_LINES = {
+    theory: f"from chemsh import {key:s}\n" for theory, key in _MM_THEORY_KEYS.items()
+}
+# Sentinel distinguishing a missing parameter from one explicitly set to None
+_MISSING = object()
+# Allowed values for the QM parameters with a restricted set of options, paired
+# with the error message reported for any other value
+_RESTRICTED_QM_VALUES = {
+    "method": (
+        frozenset(("HF", "DFT")),
+        "The specified method key ('{value:s}') is not valid.",
+    ),
+    "scftype": (
+        frozenset(("RHF", "UHF", "ROHF", "RKS", "UKS", "ROKS")),
+        "The 'scftype' parameter must be one of 'RHF', 'UHF' or "
+        "'ROHF' (or analogous 'rks', 'uks' or 'roks').",
+    ),
+}
+
+
+def _coerce_theory(
+    theory: str, enum_cls: type[ChemShellQMTheory | ChemShellMMTheory]
+) -> ChemShellQMTheory | ChemShellMMTheory | None:
+    """
+    Convert a user supplied theory name into a theory enum member.
+
+    Parameters
+    ----------
+    theory : str
+        The case insensitive theory name.
+    enum_cls : type[ChemShellQMTheory | ChemShellMMTheory]
+        The theory enum to convert to.
+
+    Returns
+    -------
+    ChemShellQMTheory | ChemShellMMTheory | None
+        The theory interface, or None if it is not recognised.
+    """
+    if isinstance(theory, str):
+        return enum_cls.from_name(theory)
+    return None
+
+
+# Results of validating stored (and therefore immutable) parameter nodes
+_VALIDATION_CACHE: dict[tuple, str | None] = {}
+_VALIDATION_CACHE_SIZE = 256
+
+
+def _cache_stored_validation(validator: Callable) -> Callable:
+    """
+    Memoise a parameter validator for stored parameter nodes.
+
+    Stored nodes cannot be modified, so the validation result for a given node
+    UUID never changes. Unstored nodes are always validated.
+
+    Parameters
+    ----------
+    validator : Callable
+        The validator function taking the class, value and port namespace.
+
+    Returns
+    -------
+    Callable
+        The wrapped validator.
+    """
+
+    @wraps(validator)
+    def wrapper(cls, value, ctx):
+        if not getattr(value, "is_stored", False):
+            return validator(cls, value, ctx)
+        key = (cls, validator.__name__, value.uuid)
+        if key in _VALIDATION_CACHE:
+            return _VALIDATION_CACHE[key]
+        result = validator(cls, value, ctx)
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry to keep the cache bounded
+            del _VALIDATION_CACHE[next(iter(_VALIDATION_CACHE))]
+        _VALIDATION_CACHE[key] = result
+        return result
+
+    return wrapper
+
+
+def _resolve_types(valid_type) -> tuple[type, ...]:
+    """
+    Resolve a parameter type specification into a tuple usable by `isinstance`.
+
+    Unions are flattened and parameterised generics (e.g. `tuple[str]`) are
+    reduced to their origin type, as `isinstance` accepts neither.
+
+    Parameters
+    ----------
+    valid_type
+        The type specification for a parameter.
+
+    Returns
+    -------
+    tuple[type, ...]
+        The types a parameter value may be an instance of.
+    """
+    if isinstance(valid_type, UnionType):
+        return tuple(t for arg in get_args(valid_type) for t in _resolve_types(arg))
+    origin = get_origin(valid_type)
+    return (valid_type,) if origin is None else (origin,)
+
+
+def _invalid_keys_error(invalid_keys: list[str], valid_keys: Iterable[str]) -> str:
+    """
+    Build the error message for parameter keys that are not recognised.
+
+    Parameters
+    ----------
+    invalid_keys : list[str]
+        The unrecognised parameter keys.
+    valid_keys : Iterable[str]
+        The valid parameter keys, in the order they should be listed.
+
+    Returns
+    -------
+    str
+        The error message.
+    """
+    return (
+        "The following parameter keys are invalid: "
+        f"{', '.join(invalid_keys):s}. Valid keys are: "
+        f"{', '.join(valid_keys):s}"
+    )
+
+
+def _check_parameter_types(value, type_checks: dict) -> list[str]:
+    """
+    Check the keys and value types of a set of theory parameters.
+
+    Parameters
+    ----------
+    value : Dict
+        The parameters to validate.
+    type_checks : dict[str, tuple[type, ...]]
+        The valid parameter keys mapped to their resolved types.
+
+    Returns
+    -------
+    list[str]
+        An error message for the invalid keys (if any) followed by one for each
+        parameter of the wrong type, empty if the parameters are valid.
+    """
+    errors = []
+    invalid_keys = []
+    for key, val in value.items():
+        valid_types = type_checks.get(key)
+        if valid_types is None:
+            invalid_keys.append(key)
+        elif not isinstance(val, valid_types):
+            type_names = " or ".join(t.__name__ for t in valid_types)
+            errors.append(f"The parameter '{key:s}' must be of type {type_names:s}.")
+    if invalid_keys:
+        errors.insert(0, _invalid_keys_error(invalid_keys, type_checks))
+    return errors
 
 
 class ChemShellCalculation(CalcJob):
@@ -35,6 +228,71 @@ class ChemShellCalculation(CalcJob):
     FILE_TRJPTH = "path.xyz"
     FILE_TRJFRC = "path_force.xyz"
 
+    # Default scheduler resources
+    _DEFAULT_RESOURCES: ClassVar[dict[str, int]] = {
+        "num_machines": 1,
+        "num_mpiprocs_per_machine": 4,
+    }
+
+    # Files retrieved from every calculation
+    _RETRIEVE_LIST: ClassVar[tuple[str, ...]] = (FILE_STDOUT, FILE_RESULTS)
+
+    # Supported structure file extensions
+    _VALID_EXTS: ClassVar[tuple[str, ...]] = (".xyz", ".pun", ".cjson")
+
+    # Script fragments that do not depend on the calculation inputs
+    _SCRIPT_HEADER: ClassVar[str] = "from chemsh import Fragment\n"
+    _SCRIPT_TMP_STRUCTURE: ClassVar[str] = (
+        f"structure = Fragment(coords='{FILE_TMP_STRUCTURE:s}')\n"
+    )
+    _SCRIPT_RUN: ClassVar[str] = "job.run()\njob.result.save()\n"
+    _SCRIPT_SAVE_DLFIND: ClassVar[str] = f'structure.save("{FILE_DLFIND:s}")\n'
+
+    # The valid parameter keys are fixed, so the sets used for validating the
+    # parameter inputs are built once here rather than on every validation call
+    _CALC_KEYS: ClassVar[tuple[str, ...]] = ("gradients", "hessian")
+    _VALID_CALC_KEYS: ClassVar[frozenset[str]] = frozenset(_CALC_KEYS)
+    # other options not included thus far: redidues, contraints, frag2
+    _OPT_KEYS: ClassVar[tuple[str, ...]] = (
+        "maxcycle",
+        "maxene",
+        "coordinates",
+        "algorithm",
+        "trust_radius",
+        "maxstep",
+        "tolerance",
+        "neb",
+        "nimages",
+        "nebk",
+        "dimer",
+        "delta",
+        "tsrelative",
+        "thermal",
+        "save_path",
+    )
+    _VALID_OPT_KEYS: ClassVar[frozenset[str]] = frozenset(_OPT_KEYS)
+    _QM_TYPES: ClassVar[dict[str, type]] = {
+        "theory": str,
+        "method": str,
+        "basis": str,
+        "charge": float | int,
+        "functional": str,
+        "mult": float | int,
+        "scftype": str,
+        "damping": bool,
+        "diis": bool,
+        "direct": bool,
+        "guess": str,  # TODO: file???
+        "maxiter": int,
+        "path": str,
+        "pseudopotential": str | dict,
+        "restart": bool,
+        "scf": float,
+    }
+    _QM_TYPE_CHECKS: ClassVar[dict[str, tuple[type, ...]]] = {
+        key: _resolve_types(t) for key, t in _QM_TYPES.items()
+    }
+
     @classmethod
     def define(cls, spec: CalcJobProcessSpec) -> None:
         """
@@ -148,7 +406,10 @@ class ChemShellCalculation(CalcJob):
             help=(
                 "The optimised structure of the given system, if a geometry "
                 "optimisation task was configured and successfully completed. The "
-                "structure is contained within a ChemShell '.pun' file."
+                "structure is contained within a ChemShell '.pun' file. The file is "
+                "only retrieved temporarily, so re-parsing a finished calculation "
+                "without its retrieved temporary folder fails with "
+                "ERROR_MISSING_OPTIMISED_STRUCTURE_FILE."
             ),
         )
         spec.output(
@@ -205,11 +466,9 @@ class ChemShellCalculation(CalcJob):
         )
 
         ## Metadata
-        spec.inputs["metadata"]["options"]["resources"].default = {
-            "num_machines": 1,
-            "num_mpiprocs_per_machine": 4,
-        }
-        spec.inputs["metadata"]["options"]["parser_name"].default = "chemshell"
+        options = spec.inputs["metadata"]["options"]
+        options["resources"].default = dict(cls._DEFAULT_RESOURCES)
+        options["parser_name"].default = "chemshell"
 
         # Exit Codes
         spec.exit_code(
@@ -286,12 +545,11 @@ class ChemShellCalculation(CalcJob):
             Returns `None` if no error is found otherwise returns an error message
         """
         if isinstance(value, SinglefileData):
-            if value.filename[-4:] not in [".xyz", ".pun"]:
-                if value.filename[-6:] != ".cjson":
-                    return (
-                        "Structure file must be either an '.xyz', '.pun' or "
-                        "'.cjson' formatted structure file."
-                    )
+            if not value.filename.endswith(cls._VALID_EXTS):
+                return (
+                    "Structure file must be either an '.xyz', '.pun' or "
+                    "'.cjson' formatted structure file."
+                )
 
         return None
 
@@ -305,9 +563,10 @@ class ChemShellCalculation(CalcJob):
          : tuple[str]
             A tuple of valid parameter keys for the ChemShell calculation.
         """
-        return ("gradients", "hessian")
+        return cls._CALC_KEYS
 
     @classmethod
+    @_cache_stored_validation
     def validate_calculation_parameters(cls, value: Dict | None, _) -> str | None:
         """
         Validate the ChemShell Single Point calculation input parameters.
@@ -324,25 +583,25 @@ class ChemShellCalculation(CalcJob):
             Returns None if the parameters are valid, otherwise returns an error
             message string.
         """
+        if value is None:
+            return None
+
+        # All the parameter errors are collected and reported together
+        errors = []
+
         # Check for valid parameter keys
-        invalid_keys = set(value.keys()).difference(
-            set(cls.get_valid_calculation_parameter_keys())
-        )
+        invalid_keys = [k for k in value.keys() if k not in cls._VALID_CALC_KEYS]
         if invalid_keys:
-            return (
-                f"The following parameter keys are invalid: "
-                f"{', '.join(invalid_keys):s}. Valid keys are: "
-                f"{', '.join(cls.get_valid_calculation_parameter_keys()):s}"
-            )
+            errors.append(_invalid_keys_error(invalid_keys, cls._CALC_KEYS))
 
-        if "gradients" in value.keys():
-            if not isinstance(value.get("gradients"), bool):
-                return "The 'gradients' parameter must be a Boolean value."
-        if "hessian" in value.keys():
-            if not isinstance(value.get("hessian"), bool):
-                return "The 'hessian' parameter must be a Boolean value."
+        gradients = value.get("gradients", _MISSING)
+        if gradients is not _MISSING and not isinstance(gradients, bool):
+            errors.append("The 'gradients' parameter must be a Boolean value.")
+        hessian = value.get("hessian", _MISSING)
+        if hessian is not _MISSING and not isinstance(hessian, bool):
+            errors.append("The 'hessian' parameter must be a Boolean value.")
 
-        return None
+        return "; ".join(errors) if errors else None
 
     @classmethod
     def get_valid_optimisation_parameter_keys(cls) -> tuple[str]:
@@ -355,26 +614,10 @@ class ChemShellCalculation(CalcJob):
             A tuple of valid optimisation parameter keys for the ChemShell
             calculation.
         """
-        # other options not included thus far: redidues, contraints, frag2
-        return (
-            "maxcycle",
-            "maxene",
-            "coordinates",
-            "algorithm",
-            "trust_radius",
-            "maxstep",
-            "tolerance",
-            "neb",
-            "nimages",
-            "nebk",
-            "dimer",
-            "delta",
-            "tsrelative",
-            "thermal",
-            "save_path",
-        )
+        return cls._OPT_KEYS
 
     @classmethod
+    @_cache_stored_validation
     def validate_optimisation_parameters(cls, value: Dict | None, _) -> str | None:
         """
         Validate the ChemShell optimisation input parameters.
@@ -391,20 +634,20 @@ class ChemShellCalculation(CalcJob):
             Returns None if the parameters are valid, otherwise returns an error message
             string.
         """
+        if value is None:
+            return None
+
+        # All the parameter errors are collected and reported together
+        errors = []
+
         # Check for invalid parameters keys
-        invalid_keys = set(value.keys()).difference(
-            set(cls.get_valid_optimisation_parameter_keys())
-        )
+        invalid_keys = [k for k in value.keys() if k not in cls._VALID_OPT_KEYS]
         if invalid_keys:
-            return (
-                "The following parameter keys are invalid: "
-                f"{', '.join(invalid_keys):s}. Valid keys are: "
-                f"{', '.join(cls.get_valid_optimisation_parameter_keys()):s}"
-            )
+            errors.append(_invalid_keys_error(invalid_keys, cls._OPT_KEYS))
 
         # TODO: check the types of the parameters
 
-        return None
+        return "; ".join(errors) if errors else None
 
     @classmethod
     def get_valid_qm_paramater_keys(cls) -> dict[str:type]:
@@ -416,26 +659,10 @@ class ChemShellCalculation(CalcJob):
         validKeys : dict[str: type]
             A tuple of valid Theory parameter keys for the ChemShell calculation.
         """
-        return {
-            "theory": str,
-            "method": str,
-            "basis": str,
-            "charge": float | int,
-            "functional": str,
-            "mult": float | int,
-            "scftype": str,
-            "damping": bool,
-            "diis": bool,
-            "direct": bool,
-            "guess": str,  # TODO: file???
-            "maxiter": int,
-            "path": str,
-            "pseudopotential": str | dict,
-            "restart": bool,
-            "scf": float,
-        }
+        return dict(cls._QM_TYPES)
 
     @classmethod
+    @_cache_stored_validation
     def validate_qm_parameters(cls, value: Dict | None, _) -> str | None:
         """
         Validate the Theory object parameters to be passed to the ChemShell calculation.
@@ -452,51 +679,29 @@ class ChemShellCalculation(CalcJob):
             Returns None if the parameters are valid, otherwise returns an error
             message string.
         """
-        # Check the specified theory interface
-        if value.get("theory", "").upper() not in ChemShellQMTheory.__members__:
-            theory = value.get("theory", "")
-            return (
-                f"The specified theory '{theory:s}' is not a valid "
-                "ChemShell theory interface within the AiiDA-ChemShell workflow."
-            )
+        if value is None:
+            return None
 
-        valid_keys = cls.get_valid_qm_paramater_keys()
+        # All the parameter errors are collected and reported together
+        errors = []
 
-        # Check for valid parameter keys
-        invalid_keys = set(value.keys()).difference(set(valid_keys.keys()))
-        if invalid_keys:
-            return (
-                "The following parameter keys are invalid: "
-                f"{', '.join(invalid_keys):s}. Valid keys are: "
-                f"{', '.join(valid_keys.keys()):s}"
+        # Check the specified theory interface
+        theory = value.get("theory", "")
+        if _coerce_theory(theory, ChemShellQMTheory) is None:
+            errors.append(
+                f"The specified theory '{theory!s}' is not a valid "
+                "ChemShell theory interface within the AiiDA-ChemShell workflow."
             )
 
-        # Check for valid parameter types
-        for key, val in value.items():
-            if not isinstance(val, valid_keys[key]):
-                if valid_keys[key] == (float | int):
-                    return (
-                        f"The parameter '{key:s}' must be of type {float.__name__:s}."
-                    )
-                return (
-                    f"The parameter '{key:s}' must be of type "
-                    f"{valid_keys[key].__name__:s}."
-                )
+        errors += _check_parameter_types(value, cls._QM_TYPE_CHECKS)
 
         # Check for valid parameter values if value options are restricted
-        if "method" in value.keys():
-            method = value.get("method").upper()
-            if method not in ["HF", "DFT"]:
-                return f"The specified method key ('{method:s}') is not valid."
-        if "scftype" in value.keys():
-            opts = ["RHF", "UHF", "ROHF", "RKS", "UKS", "ROKS"]
-            if value.get("scftype").upper() not in opts:
-                return (
-                    "The 'scftype' parameter must be one of 'RHF', 'UHF' or "
-                    "'ROHF' (or analogous 'rks', 'uks' or 'roks')."
-                )
+        for key, (allowed, message) in _RESTRICTED_QM_VALUES.items():
+            option = value.get(key)
+            if isinstance(option, str) and option.upper() not in allowed:
+                errors.append(message.format(value=option.upper()))
 
-        return None
+        return "; ".join(errors) if errors else None
 
     @classmethod
     def get_valid_mm_paramater_keys(cls, theory: str = "") -> dict[str:type]:
@@ -591,6 +796,29 @@ class ChemShellCalculation(CalcJob):
         return valid_keys
 
     @classmethod
+    @lru_cache(maxsize=4)
+    def _get_mm_type_checks(cls, theory: str = "") -> dict[str, tuple[type, ...]]:
+        """
+        Return the resolved parameter types for the ChemShell MM interface.
+
+        Parameters
+        ----------
+        theory : str
+            The name of the MM theory interface (e.g. 'DL_POLY'), any other value
+            returns the type checks of the generic MM parameters.
+
+        Returns
+        -------
+        typeChecks : dict[str, tuple[type, ...]]
+            The valid MM parameter keys mapped to the types accepted for each.
+        """
+        return {
+            key: _resolve_types(t)
+            for key, t in cls.get_valid_mm_paramater_keys(theory).items()
+        }
+
+    @classmethod
+    @_cache_stored_validation
     def validate_mm_parameters(cls, value: Dict | None, _) -> str | None:
         """
         Validate the MM interface parameter inputs to the ChemShell calculation.
@@ -607,79 +835,39 @@ class ChemShellCalculation(CalcJob):
             Returns None if the parameters are valid, otherwise returns an
             error message string.
         """
-        theory = value.get("theory", "").upper()
-        if theory not in ChemShellMMTheory.__members__:
-            return (
-                f"The specified MM theory '{theory:s}' is not a "
-                "valid ChemShell MM interface within the AiiDA-ChemShell workflow."
-            )
+        if value is None:
+            return None
 
-        valid_keys = cls.get_valid_mm_paramater_keys(theory)
-        invalid_keys = set(value.keys()).difference(set(valid_keys.keys()))
-        if invalid_keys:
-            # Checks for invalid parameter keys
+        name = value.get("theory", "")
+        theory = _coerce_theory(name, ChemShellMMTheory)
+        if theory is None:
             return (
-                "The following parameter keys are invalid: "
-                f"{', '.join(invalid_keys):s}. Valid keys are: "
-                f"{', '.join(valid_keys.keys()):s}"
+                f"The specified MM theory '{str(name).upper():s}' is not a "
+                "valid ChemShell MM interface within the AiiDA-ChemShell workflow."
             )
 
-        # Check for valid parameter types
-        for key, val in value.items():
-            if not isinstance(val, valid_keys[key]):
-                return (
-                    f"The parameter '{key:s}' must be of type "
-                    f"{valid_keys[key].__name__:s}."
-                )
-        return None
+        errors = _check_parameter_types(value, cls._get_mm_type_checks(theory.name))
+        return "; ".join(errors) if errors else None
 
-    @classmethod
-    def get_qm_theory_key(cls, theory: ChemShellQMTheory) -> str:
+    @staticmethod
+    def get_qm_theory_key(theory: ChemShellQMTheory) -> str:
         """
         Get the key for the QM theory interface in ChemShell.
 
         Parameters
         ----------
         theory : ChemShellQMTheory
-            The MM theory interface to get the key for.
+            The QM theory interface to get the key for.
 
         Returns
         -------
         str
             The ChemShell class key for the QM theory interface.
         """
-        match theory:
-            case ChemShellQMTheory.CASTEP:
-                return "CASTEP"
-            case ChemShellQMTheory.CP2K:
-                return "CP2K"
-            case ChemShellQMTheory.DFTBP:
-                return "DFTBplus"
-            case ChemShellQMTheory.FHI_AIMS:
-                return "FHIaims"
-            case ChemShellQMTheory.GAMESS_UK:
-                return "GAMESS_UK"
-            case ChemShellQMTheory.GAUSSIAN:
-                return "Gaussian"
-            case ChemShellQMTheory.LSDALTON:
-                return "LSDalton"
-            case ChemShellQMTheory.MNDO:
-                return "MNDO"
-            case ChemShellQMTheory.MOLPRO:
-                return "Molpro"
-            case ChemShellQMTheory.NWCHEM:
-                return "NWChem"
-            case ChemShellQMTheory.ORCA:
-                return "ORCA"
-            case ChemShellQMTheory.PYSCF:
-                return "PySCF"
-            case ChemShellQMTheory.TURBOMOLE:
-                return "TURBOMOLE"
-
-        return ""
+        return _QM_THEORY_KEYS.get(theory, "")
 
-    @classmethod
-    def get_mm_theory_key(cls, theory: ChemShellMMTheory) -> str:
+    @staticmethod
+    def get_mm_theory_key(theory: ChemShellMMTheory) -> str:
         """
         Get the key for the MM theory interface in ChemShell.
 
@@ -693,14 +881,7 @@ class ChemShellCalculation(CalcJob):
         str
             The ChemShell class key for the MM theory interface.
         """
-        match theory:
-            case ChemShellMMTheory.DL_POLY:
-                return "DL_POLY"
-            case ChemShellMMTheory.GULP:
-                return "GULP"
-            case ChemShellMMTheory.NAMD:
-                return "NAMD"
-        return ""
+        return _MM_THEORY_KEYS.get(theory, "")
 
     def _build_process_label(self) -> str:
         """
@@ -729,21 +910,40 @@ class ChemShellCalculation(CalcJob):
         str
             The process label based on what inputs have been provided.
         """
+        inputs = node.inputs
         theory_key = ""
-        if "qm_parameters" in node.inputs:
-            if "mm_parameters" in node.inputs:
+        if "qm_parameters" in inputs:
+            if "mm_parameters" in inputs:
                 theory_key = "_(QM/MM)"
             else:
                 theory_key = "_(QM)"
         else:
             theory_key = "_(MM)"
 
-        if "optimisation_parameters" in node.inputs:
-            if node.inputs.optimisation_parameters.get("thermal", False):
-                return "ChemShell_Vibrational_Frequencies" + theory_key
-            return "ChemShell_Geometry_Optimisation" + theory_key
+        if "optimisation_parameters" in inputs:
+            if inputs.optimisation_parameters.get("thermal", False):
+                return f"ChemShell_Vibrational_Frequencies{theory_key:s}"
+            return f"ChemShell_Geometry_Optimisation{theory_key:s}"
 
-        return "ChemShell_Single_Point_Calculation" + theory_key
+        return f"ChemShell_Single_Point_Calculation{theory_key:s}"
+
+    @staticmethod
+    def _format_parameters(params: dict) -> str:
+        """
+        Format parameters as additional keyword arguments in the input script.
+
+        Parameters
+        ----------
+        params : dict
+            Dictionary of parameters to convert, any 'theory' key is skipped.
+
+        Returns
+        -------
+        str
+            The keyword arguments each preceded by ', ', or an empty string.
+        """
+        param_str = generate_parameter_string(params)
+        return f", {param_str:s}" if param_str else ""
 
     def chemsh_script_generator(self) -> str:
         """
@@ -754,98 +954,96 @@ class ChemShellCalculation(CalcJob):
         script : str
             A string containing the ChemShell input script for the calculation.
         """
+        # The inputs of a process are fixed, so the script only needs generating once
+        cached_script = getattr(self, "_input_script", None)
+        if cached_script is not None:
+            return cached_script
+
         qm_theory = None
         mm_theory = None
-        qmmm_chk = "qm_parameters" in self.inputs and "mm_parameters" in self.inputs
-
-        script = "from chemsh import Fragment\n"
-        if isinstance(self.inputs.structure, StructureData):
-            if len(self.inputs.structure.sites) < 2:
-                atom_names = [site.kind_name for site in self.inputs.structure.sites]
+        inputs = self.inputs
+        structure = inputs.structure
+        qm_node = inputs.get("qm_parameters")
+        mm_node = inputs.get("mm_parameters")
+        opt_node = inputs.get("optimisation_parameters")
+        has_qm = qm_node is not None
+        has_mm = mm_node is not None
+        has_opt = opt_node is not None
+        qmmm_chk = has_qm and has_mm
+        qm_params = qm_node.get_dict() if has_qm else None
+        mm_params = mm_node.get_dict() if has_mm else None
+
+        # The script is collected as a list of fragments and joined once at the end
+        script = [self._SCRIPT_HEADER]
+        if isinstance(structure, StructureData):
+            sites = structure.sites
+            if len(sites) < 2:
+                atom_names = [site.kind_name for site in sites]
                 coords = [
                     [UnitsConverter.angstrom_to_bohr(r) for r in site.position]
-                    for site in self.inputs.structure.sites
+                    for site in sites
                 ]
-                script += (
+                script.append(
                     f"structure = Fragment(coords={str(coords):s}, names="
                     f"{str(atom_names):s})\n"
                 )
             else:
-                script += "structure = Fragment(coords="
-                script += f"'{ChemShellCalculation.FILE_TMP_STRUCTURE:s}')\n"
-        elif isinstance(self.inputs.structure, TrajectoryData):
-            script += "structure = Fragment(coords="
-            script += f"'{ChemShellCalculation.FILE_TMP_STRUCTURE:s}')\n"
-        elif "structure_index" in self.inputs:
+                script.append(self._SCRIPT_TMP_STRUCTURE)
+        elif isinstance(structure, TrajectoryData):
+            script.append(self._SCRIPT_TMP_STRUCTURE)
+        elif "structure_index" in inputs:
             print("Not yet supported.")
             raise Exception("SinglefileData trajectories not yet supported.")
         else:  # SinglefileData
-            script += (
-                f"structure = Fragment(coords='{self.inputs.structure.filename:s}')\n"
-            )
+            script.append(f"structure = Fragment(coords='{structure.filename:s}')\n")
 
         ## Setup Theory objects
 
-        if "qm_parameters" in self.inputs:
+        if has_qm:
             # Creates a quantum mechanics Theory object
-            qm_theory = ChemShellQMTheory[
-                self.inputs.qm_parameters.get("theory").upper()
-            ]
+            qm_theory = _coerce_theory(qm_params.get("theory"), ChemShellQMTheory)
+            qm_theory_key = _QM_THEORY_KEYS.get(qm_theory)
 
-            if qm_theory != ChemShellQMTheory.NONE:
-                qm_theory_key = ChemShellCalculation.get_qm_theory_key(qm_theory)
-
-                script += f"from chemsh import {qm_theory_key:s}\n"
-                param_str = ""
-                if "qm_parameters" in self.inputs:
-                    for key in self.inputs.qm_parameters.keys():
-                        if key == "theory":
-                            continue
-                        val = self.inputs.qm_parameters.get(key)
-                        if isinstance(val, str):
-                            param_str += ", " + key + "='" + val + "'"
-                        else:
-                            param_str += ", " + key + "=" + str(val)
+            if qm_theory_key is not None:
+                script.append(_QM_IMPORT_LINES[qm_theory])
+                param_str = self._format_parameters(qm_params)
                 if qmmm_chk:
-                    script += f"qmtheory = {qm_theory_key:s}(" + param_str[1:] + ")\n"
+                    script.append(f"qmtheory = {qm_theory_key:s}({param_str[1:]})\n")
                 else:
-                    script += f"qmtheory = {qm_theory_key:s}(frag=structure"
-                    script += param_str + ")\n"
+                    script.append(
+                        f"qmtheory = {qm_theory_key:s}(frag=structure{param_str})\n"
+                    )
 
-        if "mm_parameters" in self.inputs:
+        if has_mm:
             # Creates a molecular mechanics Theory object
-            mm_theory = ChemShellMMTheory[
-                self.inputs.mm_parameters.get("theory").upper()
-            ]
-            if mm_theory != ChemShellMMTheory.NONE:
-                mm_theory_key = ChemShellCalculation.get_mm_theory_key(mm_theory)
-
-                script += f"from chemsh import {mm_theory_key:s}\n"
-                param_str = ""
-                for key in self.inputs.mm_parameters.keys():
-                    if key == "theory":
-                        continue
-                    val = self.inputs.mm_parameters.get(key)
-                    if isinstance(val, str):
-                        param_str += ", " + key + "='" + val + "'"
-                    else:
-                        param_str += ", " + key + "=" + str(val)
+            mm_theory = _coerce_theory(mm_params.get("theory"), ChemShellMMTheory)
+            mm_theory_key = _MM_THEORY_KEYS.get(mm_theory)
+            if mm_theory_key is not None:
+                script.append(_MM_IMPORT_LINES[mm_theory])
+                param_str = self._format_parameters(mm_params)
+                ff_fname = inputs.force_field_file.filename
                 if qmmm_chk:
-                    script += f"mmtheory = {mm_theory_key:s}"
-                    script += f"(ff='{self.inputs.force_field_file.filename:s}'"
-                    script += f"{param_str:s})\n"
+                    script.append(
+                        f"mmtheory = {mm_theory_key:s}(ff='{ff_fname:s}'"
+                        f"{param_str:s})\n"
+                    )
                 else:
-                    script += f"mmtheory = {mm_theory_key:s}(frag=structure, "
-                    script += f"ff='{self.inputs.force_field_file.filename:s}'"
-                    script += f"{param_str:s})\n"
+                    script.append(
+                        f"mmtheory = {mm_theory_key:s}(frag=structure, "
+                        f"ff='{ff_fname:s}'{param_str:s})\n"
+                    )
 
         # If both QM and MM are specified, create a QM/MM interface object
         if qmmm_chk:
             theory_str = "qmmm"
-            script += "from chemsh import QMMM\n"
-            script += "qmmm = QMMM(frag=structure, qm=qmtheory, mm=mmtheory, "
-            qm_region_str = str(self.inputs.qmmm_parameters.get("qm_region", []))
-            script += f"qm_region={qm_region_str:s})\n"
+            qmmm_node = inputs.get("qmmm_parameters")
+            qm_region = [] if qmmm_node is None else qmmm_node.get("qm_region", [])
+            qm_region_str = str(qm_region)
+            script.append("from chemsh import QMMM\n")
+            script.append(
+                "qmmm = QMMM(frag=structure, qm=qmtheory, mm=mmtheory, "
+                f"qm_region={qm_region_str:s})\n"
+            )
         elif mm_theory:
             theory_str = "mmtheory"
         else:
@@ -853,37 +1051,47 @@ class ChemShellCalculation(CalcJob):
 
         ## Setup Task objects
 
-        if "optimisation_parameters" in self.inputs:
+        if has_opt:
             # Run a geometry optimisation using DL_FIND
-            script += "from chemsh import Opt\n"
-            opt_str = f"job = Opt(theory={theory_str:s}"
-            for key in self.inputs.optimisation_parameters.keys():
-                if isinstance(self.inputs.optimisation_parameters.get(key), str):
-                    opt_str += ", " + key + "='"
-                    opt_str += self.inputs.optimisation_parameters.get(key) + "'"
-                else:
-                    opt_str += ", " + key + "="
-                    opt_str += str(self.inputs.optimisation_parameters.get(key))
-            script += opt_str + ")\n"
+            script.append("from chemsh import Opt\n")
+            param_str = self._format_parameters(opt_node.get_dict())
+            script.append(f"job = Opt(theory={theory_str:s}{param_str:s})\n")
         else:
             # Perform a single point energy calculation (default calculation type)
-            script += "from chemsh import SP\n"
-            if "calculation_parameters" not in self.inputs:
-                # Assign default values if none are given
-                self.inputs.calculation_parameters = Dict(dict={})
+            script.append("from chemsh import SP\n")
+            # Runs a QM single point energy calculation, default values are used
+            # for any parameters not given
+            calc_node = inputs.get("calculation_parameters")
+            calc_params = calc_node.get_dict() if calc_node is not None else {}
+            grad_str = str(calc_params.get("gradients", False))
+            hess_str = str(calc_params.get("hessian", False))
+            script.append(
+                f"job = SP(theory={theory_str:s}, gradients={grad_str:s}, "
+                f"hessian={hess_str:s})\n"
+            )
 
-            # Runs a QM single point energy calculation
-            script += f"job = SP(theory={theory_str:s}, "
-            grad_str = str(self.inputs.calculation_parameters.get("gradients", False))
-            script += f"gradients={grad_str:s}, "
-            hess_str = str(self.inputs.calculation_parameters.get("hessian", False))
-            script += f"hessian={hess_str:s})\n"
+        script.append(self._SCRIPT_RUN)
+        if has_opt:
+            script.append(self._SCRIPT_SAVE_DLFIND)
 
-        script += "job.run()\njob.result.save()\n"
-        if "optimisation_parameters" in self.inputs:
-            script += f'structure.save("{ChemShellCalculation.FILE_DLFIND}")\n'
+        self._input_script = "".join(script)
+        return self._input_script
+
+    @staticmethod
+    def _write_xyz(folder: Folder, structure: StructureData) -> None:
+        """
+        Write a structure to the temporary XYZ structure file.
 
-        return script
+        Parameters
+        ----------
+        folder : Folder
+            The temporary working directory for the calculation.
+        structure : StructureData
+            The structure to write.
+        """
+        payload = structure._prepare_xyz()[0]
+        with folder.open(ChemShellCalculation.FILE_TMP_STRUCTURE, "wb") as f:
+            f.write(payload)
 
     def prepare_for_submission(self, folder: Folder) -> CalcInfo:
         """
@@ -900,79 +1108,76 @@ class ChemShellCalculation(CalcJob):
         calcInfo : CalcInfo
             An `aiida.common.CalcInfo` instance.
         """
+        script_name = ChemShellCalculation.FILE_SCRIPT
+        stdout_name = ChemShellCalculation.FILE_STDOUT
+
         # Create the ChemShell input script
         input_script = self.chemsh_script_generator()
-        with folder.open(ChemShellCalculation.FILE_SCRIPT, "w") as f:
-            f.write(input_script)
+        with folder.open(script_name, "wb") as f:
+            f.write(input_script.encode("utf-8"))
 
         # Define the AiiDA code parameters
-        code_info = CodeInfo()
-        code_info.code_uuid = self.inputs.code.uuid
         if "chemsh.x" in str(self.inputs.code.filepath_executable):
-            code_info.cmdline_params = [
-                ChemShellCalculation.FILE_SCRIPT,
-            ]
+            cmdline_params = [script_name]
         else:
-            n_machines = self.inputs.metadata.options.resources.get("num_machines")
-            n_mpi_pm = self.inputs.metadata.options.resources.get(
-                "num_mpiprocs_per_machine"
-            )
+            resources = self.inputs.metadata.options.resources
+            n_machines = resources.get("num_machines")
+            n_mpi_pm = resources.get("num_mpiprocs_per_machine")
             tot_mpi = n_machines * n_mpi_pm
-            code_info.cmdline_params = [
+            cmdline_params = [
                 "-np",
-                self.inputs.metadata.options.resources.get("tot_num_mpiprocs", tot_mpi),
-                ChemShellCalculation.FILE_SCRIPT,
+                resources.get("tot_num_mpiprocs", tot_mpi),
+                script_name,
             ]
-        code_info.stdout_name = ChemShellCalculation.FILE_STDOUT
+        code_info = CodeInfo(
+            {
+                "code_uuid": self.inputs.code.uuid,
+                "cmdline_params": cmdline_params,
+                "stdout_name": stdout_name,
+            }
+        )
 
-        # Setup the calculation information object
-        calc_info = CalcInfo()
-        calc_info.codes_info = [code_info]
-        calc_info.retrieve_temporary_list = []
-        calc_info.provenance_exclude_list = []
-        calc_info.retrieve_list = [
-            ChemShellCalculation.FILE_STDOUT,
-            ChemShellCalculation.FILE_RESULTS,
-        ]
-        calc_info.local_copy_list = []
-
-        if isinstance(self.inputs.structure, StructureData):
-            with folder.open(ChemShellCalculation.FILE_TMP_STRUCTURE, "wb") as f:
-                f.write(self.inputs.structure._prepare_xyz()[0])
-        elif isinstance(self.inputs.structure, TrajectoryData):
-            with folder.open(ChemShellCalculation.FILE_TMP_STRUCTURE, "wb") as f:
-                index = self.inputs.structure_index.value
-                structure = self.inputs.structure.get_step_structure(index=index)
-                f.write(structure._prepare_xyz()[0])
+        # Files to be copied into the working directory from the repository
+        local_copy_list = []
+        structure = self.inputs.structure
+        if isinstance(structure, StructureData):
+            self._write_xyz(folder, structure)
+        elif isinstance(structure, TrajectoryData):
+            index = self.inputs.structure_index.value
+            self._write_xyz(folder, structure.get_step_structure(index=index))
         else:
-            calc_info.local_copy_list.append(
-                (
-                    self.inputs.structure.uuid,
-                    self.inputs.structure.filename,
-                    self.inputs.structure.filename,
-                )
-            )
+            fn = structure.filename
+            local_copy_list.append((structure.uuid, fn, fn))
 
         # If running with an MM theory a force field file is required and copied
-        if "force_field_file" in self.inputs:
-            calc_info.local_copy_list.append(
-                (
-                    self.inputs.force_field_file.uuid,
-                    self.inputs.force_field_file.filename,
-                    self.inputs.force_field_file.filename,
-                )
-            )
-
-        # If performing a geometry optimisation retrieve the generated _dl_find.pun
-        # file containing the optimised structure
-        if "optimisation_parameters" in self.inputs:
-            calc_info.retrieve_list.append(ChemShellCalculation.FILE_DLFIND)
-            if self.inputs.optimisation_parameters.get("save_path", False):
-                calc_info.retrieve_list.append(
-                    "_dl_find/" + ChemShellCalculation.FILE_TRJPTH
-                )
-                calc_info.retrieve_list.append(
-                    "_dl_find/" + ChemShellCalculation.FILE_TRJFRC
-                )
+        force_field = self.inputs.get("force_field_file")
+        if force_field is not None:
+            fn = force_field.filename
+            local_copy_list.append((force_field.uuid, fn, fn))
+
+        # If performing a geometry optimisation retrieve the generated structure file
+        # containing the optimised structure, this is only retrieved temporarily as
+        # the parser stores it as a separate SinglefileData output node (the parser
+        # does not read it following a vibrational analysis)
+        retrieve_list = list(ChemShellCalculation._RETRIEVE_LIST)
+        retrieve_temporary_list = []
+        opt_node = self.inputs.get("optimisation_parameters")
+        if opt_node is not None:
+            if not opt_node.get("thermal", False):
+                retrieve_temporary_list.append(ChemShellCalculation.FILE_DLFIND)
+            if opt_node.get("save_path", False):
+                retrieve_list += [
+                    f"_dl_find/{ChemShellCalculation.FILE_TRJPTH:s}",
+                    f"_dl_find/{ChemShellCalculation.FILE_TRJFRC:s}",
+                ]
 
-        return calc_info
+        # Setup the calculation information object
+        return CalcInfo(
+            {
+                "codes_info": [code_info],
+                "retrieve_temporary_list": retrieve_temporary_list,
+                "provenance_exclude_list": [],
+                "retrieve_list": retrieve_list,
+                "local_copy_list": local_copy_list,
+            }
+        )
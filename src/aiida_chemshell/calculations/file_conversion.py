@@ -1,5 +1,7 @@
 """CalcJob to create individual extended XYZ files for steps in an optimisation."""
 
+from typing import ClassVar
+
 from aiida.common import CalcInfo, CodeInfo
 from aiida.common.folders import Folder
 from aiida.engine import CalcJob, CalcJobProcessSpec, PortNamespace
@@ -11,6 +13,12 @@ from aiida_chemshell.units import UnitsConverter
 class CreateJanusTrainingInputsCalcJob(CalcJob):
     """CalcJob to split an XYZ trajectory into individual ext XYZ files."""
 
+    # Default scheduler resources
+    _DEFAULT_RESOURCES: ClassVar[dict[str, int]] = {
+        "num_machines": 1,
+        "num_mpiprocs_per_machine": 2,
+    }
+
     @classmethod
     def define(cls, spec: CalcJobProcessSpec) -> None:
         """Define the inputs, outputs and metadata for the CalcJob."""
@@ -67,13 +75,9 @@ class CreateJanusTrainingInputsCalcJob(CalcJob):
         )
 
         ## Metadata
-        spec.inputs["metadata"]["options"]["resources"].default = {
-            "num_machines": 1,
-            "num_mpiprocs_per_machine": 2,
-        }
-        spec.inputs["metadata"]["options"][
-            "parser_name"
-        ].default = "chemshell.file_conversion.mlip_training"
+        options = spec.inputs["metadata"]["options"]
+        options["resources"].default = dict(cls._DEFAULT_RESOURCES)
+        options["parser_name"].default = "chemshell.file_conversion.mlip_training"
 
         # Exit Codes
         spec.exit_code(
@@ -95,7 +99,6 @@ class CreateJanusTrainingInputsCalcJob(CalcJob):
         lines = content.split("\n")
         natoms = int(lines[0])
         if len(lines) % (natoms + 2) != 0:
-            print(lines)
             return "Invalid XYZ trajectory structure detected."
         if len(lines) // (natoms + 2) < 5:
             return "Not enough individual configurations within input trajectory."
@@ -127,21 +130,21 @@ class CreateJanusTrainingInputsCalcJob(CalcJob):
         with folder.open("isolated_atoms.xyz", "w") as f:
             f.write(self.create_isolated_atom_energy_xyz())
 
+        code = self.inputs.code
         code_info = CodeInfo()
-        code_info.code_uuid = self.inputs.code.uuid
-        if "chemsh.x" in str(self.inputs.code.filepath_executable):
+        code_info.code_uuid = code.uuid
+        if "chemsh.x" in str(code.filepath_executable):
             code_info.cmdline_params = [
                 "input.py",
             ]
         else:
-            n_machines = self.inputs.metadata.options.resources.get("num_machines")
-            n_mpi_pm = self.inputs.metadata.options.resources.get(
-                "num_mpiprocs_per_machine"
-            )
+            resources = self.inputs.metadata.options.resources
+            n_machines = resources.get("num_machines")
+            n_mpi_pm = resources.get("num_mpiprocs_per_machine")
             tot_mpi = n_machines * n_mpi_pm
             code_info.cmdline_params = [
                 "-np",
-                self.inputs.metadata.options.resources.get("tot_num_mpiprocs", tot_mpi),
+                resources.get("tot_num_mpiprocs", tot_mpi),
                 "input.py",
             ]
 
@@ -149,17 +152,11 @@ class CreateJanusTrainingInputsCalcJob(CalcJob):
         calc_info.codes_info = [code_info]
         calc_info.provenance_exclude_list = []
         calc_info.retrieve_temporary_list = ["train.xyz", "valid.xyz", "test.xyz"]
+        path = self.inputs.path
+        force = self.inputs.force
         calc_info.local_copy_list = [
-            (
-                self.inputs.path.uuid,
-                self.inputs.path.filename,
-                self.inputs.path.filename,
-            ),
-            (
-                self.inputs.force.uuid,
-                self.inputs.force.filename,
-                self.inputs.force.filename,
-            ),
+            (path.uuid, path.filename, path.filename),
+            (force.uuid, force.filename, force.filename),
         ]
 
         return calc_info
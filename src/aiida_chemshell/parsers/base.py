@@ -1,79 +1,85 @@
 """Defines the calculation parsers for the ChemShell AiiDA plugin."""
 
 import json
+import os
+import re
 
 import numpy
-from aiida.common import ModificationNotAllowed
 from aiida.engine import ExitCode
 from aiida.orm import ArrayData, Dict, Float, SinglefileData
 from aiida.parsers.parser import Parser
 
 from aiida_chemshell.calculations.base import ChemShellCalculation
 
+# Captures the energy (last value) of each optimisation step line in the output log
+_STEP_ENERGY_RE = re.compile(
+    r"Energy calculation finished[^\n]*?(\S+)[^\S\n]*$", re.MULTILINE
+)
+
 
 class ChemShellParser(Parser):
     """AiiDA parser plugin for ChemShell calculations."""
 
     def parse(self, **kwargs):
         """Parse the output of a ChemShell calculation."""
-        if ChemShellCalculation.FILE_STDOUT not in self.retrieved.list_object_names():
+        retrieved_names = frozenset(self.retrieved.list_object_names())
+        if ChemShellCalculation.FILE_STDOUT not in retrieved_names:
             return self.exit_codes.ERROR_STDOUT_NOT_FOUND
-        if ChemShellCalculation.FILE_RESULTS not in self.retrieved.list_object_names():
+        if ChemShellCalculation.FILE_RESULTS not in retrieved_names:
             return self.exit_codes.ERROR_RESULTS_FILE_NOT_FOUND
 
         # Read the 'json' formatted results file
-        results = json.loads(
-            self.retrieved.get_object_content(ChemShellCalculation.FILE_RESULTS, "rb")
-        )
+        with self.retrieved.open(ChemShellCalculation.FILE_RESULTS, "rb") as f:
+            results = json.load(f)
 
         # Extract the final energy
+        energy = results.get("energy")
+        if not isinstance(energy, list) or not energy:
+            return self.exit_codes.ERROR_MISSING_FINAL_ENERGY
         try:
-            self.out("energy", Float(results["energy"][0], label="Final SCF Energy"))
-        except (KeyError, ValueError):
+            self.out("energy", Float(energy[0], label="Final SCF Energy"))
+        except (TypeError, ValueError):
             return self.exit_codes.ERROR_MISSING_FINAL_ENERGY
-        except ModificationNotAllowed as e:
-            raise e
 
-        # Extract gradients/hessian if they are requested
+        # Extract gradients/hessian if they are requested, both are stored as arrays
+        # of a single output node
         if "calculation_parameters" in self.node.inputs:
-            array_desc = "1st and/or 2nd derivatives calculated with ChemShell"
-            if self.node.inputs.calculation_parameters.get("gradients", False):
-                try:
-                    gradients = numpy.array(results["gradients"])
-                except (KeyError, ValueError):
+            calc_params = self.node.inputs.calculation_parameters.get_dict()
+            arrays = {}
+            for key in ("gradients", "hessian"):
+                if not calc_params.get(key, False):
+                    continue
+                if key not in results:
                     return self.exit_codes.ERROR_MISSING_GRADIENTS
-                else:
-                    grad_data = ArrayData(
-                        label="Energy Derivative Arrays",
-                        description=array_desc,
-                    )
-                    grad_data.set_array("gradients", gradients)
-                    self.out("gradients", grad_data)
-            if self.node.inputs.calculation_parameters.get("hessian", False):
                 try:
-                    hessian = numpy.array(results["hessian"])
-                except (KeyError, ValueError):
+                    arrays[key] = numpy.asarray(results[key], dtype=numpy.float64)
+                except (TypeError, ValueError):
                     return self.exit_codes.ERROR_MISSING_GRADIENTS
-                else:
-                    if "gradients" in self.outputs:
-                        self.outputs["gradients"].set_array("hessian", hessian)
-                    else:
-                        grad_data = ArrayData(
-                            label="Energy Derivative Arrays",
-                            description=array_desc,
-                        )
-                        grad_data.set_array("hessian", hessian)
-                        self.out("gradients", grad_data)
+            if arrays:
+                grad_data = ArrayData(
+                    label="Energy Derivative Arrays",
+                    description="1st and/or 2nd derivatives calculated with ChemShell",
+                )
+                for name, array in arrays.items():
+                    grad_data.set_array(name, array)
+                self.out("gradients", grad_data)
 
         # If the calculation was a geometry optimisation, store the optimised structure
         if "optimisation_parameters" in self.node.inputs:
+            # The optimised structure file is only retrieved temporarily
+            retrieved_temporary_folder = kwargs.get("retrieved_temporary_folder", None)
+            dlfind_path = None
+            if retrieved_temporary_folder is not None:
+                dlfind_path = os.path.join(
+                    retrieved_temporary_folder, ChemShellCalculation.FILE_DLFIND
+                )
             if self.node.inputs.optimisation_parameters.get("thermal", False):
                 self.parse_vibrational_analysis(
                     self.retrieved.get_object_content(
                         ChemShellCalculation.FILE_STDOUT, "r"
                     )
                 )
-            elif ChemShellCalculation.FILE_DLFIND in self.retrieved.list_object_names():
+            elif dlfind_path is not None and os.path.isfile(dlfind_path):
                 descrip = "Optimised structure from a ChemShell optimisation"
                 input_pk = self.node.inputs.structure.pk
                 descrip += f" of node {input_pk}"
@@ -81,7 +87,7 @@ class ChemShellParser(Parser):
                     input_fname = self.node.inputs.structure.filename
                     descrip += f" ({input_fname})"
                 # Store the optimised structure file
-                with self.retrieved.open(ChemShellCalculation.FILE_DLFIND, "rb") as f:
+                with open(dlfind_path, "rb") as f:
                     self.out(
                         "optimised_structure",
                         SinglefileData(
@@ -100,10 +106,7 @@ class ChemShellParser(Parser):
                 return self.exit_codes.ERROR_MISSING_OPTIMISED_STRUCTURE_FILE
 
             if self.node.inputs.optimisation_parameters.get("save_path", False):
-                if (
-                    ChemShellCalculation.FILE_TRJPTH
-                    in self.retrieved.list_object_names()
-                ):
+                if ChemShellCalculation.FILE_TRJPTH in retrieved_names:
                     with self.retrieved.open(
                         ChemShellCalculation.FILE_TRJPTH, "r"
                     ) as f:
@@ -140,6 +143,10 @@ class ChemShellParser(Parser):
         read = False
         energies = {}
         modes = []
+        # Nothing before the first analysis section is used, so avoid splitting the
+        # (potentially very long) preceding optimisation output into lines
+        start = stdout.find("Thermochemical analysis")
+        stdout = stdout[start:] if start >= 0 else ""
         for line in stdout.split("\n"):
             if read:
                 line_vals = line.split()
@@ -177,10 +184,7 @@ class ChemShellParser(Parser):
 
     def parse_optimisation_path(self, stdout: str) -> None:
         """Extract per step values from the optimisation job."""
-        energies = []
-        for line in stdout.split("\n"):
-            if "Energy calculation finished" in line:
-                energies.append(float(line.split()[-1]))
+        energies = [float(x) for x in _STEP_ENERGY_RE.findall(stdout)]
 
         results = ArrayData(
             label="Optimisation Path Properties",
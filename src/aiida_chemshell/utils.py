@@ -2,10 +2,36 @@
 
 from enum import Enum, auto
 
+import numpy
 from aiida.orm import StructureData
+from aiida.orm.nodes.data.structure import Kind, Site
 
 
-class ChemShellQMTheory(Enum):
+class _ChemShellTheory(Enum):
+    """Base enum for the ChemShell theory interfaces."""
+
+    @classmethod
+    def from_name(cls, name: str):
+        """
+        Return the theory interface for a case insensitive name.
+
+        Member names are all upper case, so the enum's own name mapping serves as
+        the case insensitive lookup table once the name is upper cased.
+
+        Parameters
+        ----------
+        name : str
+            The name of the theory interface.
+
+        Returns
+        -------
+        _ChemShellTheory | None
+            The theory interface, or None if the name is not recognised.
+        """
+        return cls.__members__.get(name.upper())
+
+
+class ChemShellQMTheory(_ChemShellTheory):
     """Enum fr the ChemShell theory interfaces."""
 
     NONE = auto()
@@ -24,7 +50,7 @@ class ChemShellQMTheory(Enum):
     TURBOMOLE = auto()
 
 
-class ChemShellMMTheory(Enum):
+class ChemShellMMTheory(_ChemShellTheory):
     """Enum for the ChemShell MM theory interfaces."""
 
     NONE = auto()
@@ -33,27 +59,53 @@ class ChemShellMMTheory(Enum):
     NAMD = auto()
 
 
-# Not covered by test suite as this function is not yet used by production code
-def chemsh_punch_to_structure_data(data: str) -> StructureData:  # pragma: no cover
+def chemsh_punch_to_structure_data(data: str) -> StructureData:
     """Create a AiiDA StructureData object from a ChemShell punch file."""
     structure = StructureData(pbc=[False, False, False])
 
-    lines = data.split("\n")
-
-    i = 0
-    while i < len(lines):
-        if "coordinates records" in lines[i]:
-            natms = int(lines[i].split()[-1])
-            for _a in range(natms):
-                i += 1
-                line = lines[i].split()
-                atm = line[0]
-                x = float(line[1])
-                y = float(line[2])
-                z = float(line[3])
-                structure.append_atom(position=(x, y, z), symbols=atm)
-
-        i += 1
+    symbols = []
+    positions = []
+
+    # Only the coordinate blocks are needed, so locate them directly rather than
+    # splitting the whole (potentially very large) file into lines
+    pos = data.find("coordinates records")
+    while pos >= 0:
+        header_start = data.rfind("\n", 0, pos) + 1
+        header_end = data.find("\n", pos)
+        if header_end < 0:
+            header_end = len(data)
+        natms = int(data[header_start:header_end].split()[-1])
+        # Find the end of the block's atom lines and split only those
+        block_end = header_end
+        for _a in range(natms):
+            block_end = data.find("\n", block_end + 1)
+            if block_end < 0:
+                block_end = len(data)
+                break
+        block = data[header_end + 1 : block_end].split("\n") if natms else []
+        if block:
+            # Parse all the coordinates of the block in a single call
+            coords = numpy.loadtxt(block, usecols=(1, 2, 3), ndmin=2)
+            positions += coords.tolist()
+            symbols += [line.split(maxsplit=1)[0] for line in block]
+        # Continue the search after the end of this block
+        pos = data.find("coordinates records", block_end)
+
+    # Set all the kinds (one per element, named by its symbol as append_atom would)
+    # and sites at once, rather than appending and re-checking the kinds per atom
+    if symbols:
+        structure.base.attributes.set_many(
+            {
+                "kinds": [
+                    Kind(symbols=symbol, name=symbol).get_raw()
+                    for symbol in dict.fromkeys(symbols)
+                ],
+                "sites": [
+                    Site(kind_name=symbol, position=position).get_raw()
+                    for symbol, position in zip(symbols, positions, strict=True)
+                ],
+            }
+        )
 
     return structure
 
@@ -76,15 +128,7 @@ def generate_parameter_string(params: dict) -> str:
     s : str
         Comma separated string of parameters.
     """
-    s = ""
-    for key in params:
-        if key == "theory":
-            continue
-        if isinstance(params[key], str):
-            s += f"{key}='{params[key]}', "
-        else:
-            s += f"{key}={params[key]}, "
-    return s.rstrip(", ")
+    return ", ".join(f"{key}={val!r}" for key, val in params.items() if key != "theory")
 
 
 def generate_default_mlip_fine_tune_config():
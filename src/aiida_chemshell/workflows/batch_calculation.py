@@ -74,7 +74,7 @@ class BatchProcessWorkChain(WorkChain):
         self.structures_from_files = {}
         if "structure_files" in self.inputs:
             for _key, file in self.inputs.structure_files.items():
-                if file.filename[-4:] != ".xyz":
+                if not file.filename.endswith(".xyz"):
                     self.report(
                         "Only XYZ structured trajectory files are currently "
                         f"supported, {file.filename} will be skipped..."
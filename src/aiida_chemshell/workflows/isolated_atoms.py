@@ -100,11 +100,12 @@ class IsolatedAtomicEnergiesWorkChain(WorkChain):
 
     def _atom_types_from_file(self) -> None:
         """Determine the unique atom types from a SinglefileData object."""
-        if self.inputs.structure.filename[-4:] == ".xyz":
+        filename = self.inputs.structure.filename
+        if filename.endswith(".xyz"):
             self._atom_types_from_xyz()
-        elif self.inputs.structure.filename[-6:] == ".cjson":
+        elif filename.endswith(".cjson"):
             self._atom_types_from_cjson()
-        elif self.inputs.structure.filename[-4:] == ".pun":
+        elif filename.endswith(".pun"):
             self._atom_types_from_pun()
         return
 
@@ -2,6 +2,7 @@
 
 import os
 import pathlib
+import shutil
 
 import numpy
 import pytest
@@ -22,10 +23,19 @@ def pytest_configure(config):
         "markers",
         "xfail_aiida_2_8: mark test as expected failure if aiida-core is < 2.8",
     )
+    config.addinivalue_line(
+        "markers",
+        "requires_chemshell: skip test if the ChemShell executable is not available",
+    )
 
 
 def pytest_runtest_setup(item):
-    """Evaluate the custom marker before running the test."""
+    """Evaluate the custom markers before running the test."""
+    if item.get_closest_marker("requires_chemshell"):
+        chemsh_bin = os.environ.get("CHEMSHELL_BIN", "chemsh")
+        if shutil.which(chemsh_bin) is None:
+            pytest.skip(f"ChemShell executable '{chemsh_bin:s}' not found.")
+
     marker = item.get_closest_marker("xfail_aiida_2_8")
     if marker:
         if parse_version(aiida_core_version) < parse_version("2.8.0"):
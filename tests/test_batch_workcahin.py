@@ -6,6 +6,8 @@ from aiida.orm import Dict
 
 from aiida_chemshell.workflows.batch_calculation import BatchProcessWorkChain
 
+pytestmark = pytest.mark.requires_chemshell
+
 
 def test_batch_from_trajectorydata(chemsh_code, water_trajectory_object):
     """DFT based single point test."""
@@ -1,11 +1,14 @@
 """Tests for performing calculation processes with aiida_chemshell."""
 
+import pytest
 from aiida.engine import run
 from aiida.orm import Dict
 from numpy.linalg import norm
 
 from aiida_chemshell.calculations.base import ChemShellCalculation
 
+pytestmark = pytest.mark.requires_chemshell
+
 
 def test_sp_calculation_qm_hf(chemsh_code, get_test_data_file):
     """HF based single point test."""
@@ -216,7 +219,7 @@ def test_opt_calculation_dlpoly(chemsh_code, get_test_data_file):
 
     ofiles = results.get("retrieved").list_object_names()
     assert ChemShellCalculation.FILE_STDOUT in ofiles
-    assert ChemShellCalculation.FILE_DLFIND in ofiles
+    assert ChemShellCalculation.FILE_DLFIND not in ofiles
     assert ChemShellCalculation.FILE_RESULTS in ofiles
 
     assert (
@@ -2,7 +2,25 @@
 
 from aiida.orm import Dict
 
-from aiida_chemshell.calculations.base import ChemShellCalculation
+from aiida_chemshell.calculations.base import (
+    _VALIDATION_CACHE,
+    ChemShellCalculation,
+    _cache_stored_validation,
+)
+
+
+class _CountingValidator:
+    """Parameter validator recording how often it is evaluated."""
+
+    def __init__(self):
+        self.calls = 0
+
+        @_cache_stored_validation
+        def validate(cls, value, _):
+            self.calls += 1
+            return "The parameters are invalid."
+
+        self.validate = validate
 
 
 def test_qm_theory_validation(generate_calcjob, generate_inputs):
@@ -292,3 +310,142 @@ def test_missing_mm_for_qmmm_validation(generate_calcjob, generate_inputs):
         raise AssertionError(
             "No error caught during optimisation parameter validation."
         )
+
+
+def test_mm_input_validation(generate_calcjob, generate_inputs):
+    """Test the type validation of MM parameters accepting multiple types."""
+    inputs = generate_inputs(
+        mm={"theory": "DL_POLY", "input": 1},
+        structure_fname="butanol.cjson",
+        ff_fname="butanol.ff",
+    )
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "The parameter 'input' must be of type str or tuple." in str(e)
+    except Exception as e:
+        raise AssertionError(
+            f"Wrong error caught during MM parameter validation: {str(e)}"
+        ) from e
+    else:
+        raise AssertionError("No error caught during MM parameter validation.")
+
+
+def test_non_string_theory_validation(generate_calcjob, generate_inputs):
+    """Test that a non string theory is reported as an invalid theory."""
+    inputs = generate_inputs(qm={"theory": ["NWChem"]}, structure_fname="butanol.cjson")
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "is not a valid ChemShell theory interface" in str(e)
+    else:
+        raise AssertionError("No error caught when providing a non string theory.")
+
+
+def test_mm_valid_keys_copy(generate_calcjob, generate_inputs):
+    """Test that modifying the returned valid MM keys does not affect validation."""
+    valid_keys = ChemShellCalculation.get_valid_mm_paramater_keys("GULP")
+    valid_keys["bogus"] = int
+    assert "bogus" not in ChemShellCalculation.get_valid_mm_paramater_keys("GULP")
+
+    inputs = generate_inputs(
+        mm={"theory": "GULP", "bogus": 1},
+        structure_fname="butanol.cjson",
+        ff_fname="butanol.ff",
+    )
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "bogus" in str(e)
+    else:
+        raise AssertionError("No error caught for an invalid MM parameter key.")
+
+
+def test_qm_input_validation_reports_all_errors(generate_calcjob, generate_inputs):
+    """Test that all QM parameter errors are reported together."""
+    inputs = generate_inputs(
+        qm={"theory": "NWChem", "method": "KF", "chrg": -1.0, "mult": "1"}
+    )
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "chrg" in str(e)
+        assert "The parameter 'mult' must be of type" in str(e)
+        assert "method key ('KF') is not valid" in str(e)
+    except Exception as e:
+        raise AssertionError(
+            f"Wrong error caught during QM parameter validation: {str(e)}"
+        ) from e
+    else:
+        raise AssertionError("No error caught during QM parameter validation.")
+
+
+def test_qm_theory_validation_reports_all_errors(generate_calcjob, generate_inputs):
+    """Test that an invalid QM theory is reported with the other QM errors."""
+    inputs = generate_inputs(qm={"theory": "INVALID", "chrg": -1.0, "mult": "1"})
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "theory 'INVALID' is not a valid ChemShell theory" in str(e)
+        assert "chrg" in str(e)
+        assert "The parameter 'mult' must be of type" in str(e)
+    else:
+        raise AssertionError("No error caught during QM parameter validation.")
+
+
+def test_calculation_validation_reports_all_errors(generate_calcjob, generate_inputs):
+    """Test that invalid keys are reported with the calculation parameter errors."""
+    inputs = generate_inputs(sp={"gradients": 1, "foo": 2})
+    try:
+        generate_calcjob(ChemShellCalculation, inputs)
+    except ValueError as e:
+        assert "The following parameter keys are invalid: foo." in str(e)
+        assert "The 'gradients' parameter must be a Boolean value." in str(e)
+    else:
+        raise AssertionError("No error caught during calculation validation.")
+
+
+def test_validation_cache_stored_node():
+    """Test that validating a stored parameters node twice uses the cached result."""
+    _VALIDATION_CACHE.clear()
+    validator = _CountingValidator()
+    value = Dict({"gradients": True}).store()
+
+    result = validator.validate(ChemShellCalculation, value, None)
+    assert validator.validate(ChemShellCalculation, value, None) == result
+    assert validator.calls == 1
+
+
+def test_validation_cache_unstored_node():
+    """Test that unstored parameters nodes are always validated."""
+    _VALIDATION_CACHE.clear()
+    validator = _CountingValidator()
+    value = Dict({"gradients": True})
+
+    validator.validate(ChemShellCalculation, value, None)
+    validator.validate(ChemShellCalculation, value, None)
+    assert validator.calls == 2
+    assert not _VALIDATION_CACHE
+
+
+def test_validation_cache_error_per_validator_and_class():
+    """Test that cached error results are kept per validator and class."""
+
+    class SubCalculation(ChemShellCalculation):
+        pass
+
+    _VALIDATION_CACHE.clear()
+    value = Dict({"theory": "INVALID"}).store()
+
+    qm_error = ChemShellCalculation.validate_qm_parameters(value, None)
+    mm_error = ChemShellCalculation.validate_mm_parameters(value, None)
+    assert "not a valid ChemShell theory interface" in qm_error
+    assert "not a valid ChemShell MM interface" in mm_error
+    assert _VALIDATION_CACHE == {
+        (ChemShellCalculation, "validate_qm_parameters", value.uuid): qm_error,
+        (ChemShellCalculation, "validate_mm_parameters", value.uuid): mm_error,
+    }
+
+    assert SubCalculation.validate_qm_parameters(value, None) == qm_error
+    assert (SubCalculation, "validate_qm_parameters", value.uuid) in _VALIDATION_CACHE
+    assert len(_VALIDATION_CACHE) == 3
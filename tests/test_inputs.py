@@ -81,6 +81,18 @@ def test_default_qmmm_sp(generate_calcjob, generate_inputs):
     assert "job = SP(theory=qmmm, gradients=False, hessian=False)\n" in script_txt
 
 
+def test_qmmm_sp_without_qmmm_parameters(generate_calcjob, generate_inputs):
+    """Test qmmm script generation when no qmmm_parameters are given."""
+    inputs = generate_inputs(
+        qm={"method": "HF"}, structure_fname="h2o_dimer.cjson", ff_fname="h2o_dimer.ff"
+    )
+    del inputs["qmmm_parameters"]
+    tmp_pth, _ = generate_calcjob(ChemShellCalculation, inputs)
+
+    script_txt = (tmp_pth / ChemShellCalculation.FILE_SCRIPT).read_text()
+    assert "mm=mmtheory, qm_region=[])\n" in script_txt
+
+
 def test_default_qm_opt(generate_calcjob, generate_inputs):
     """Test defaults for qm optimisation script generation."""
     inputs = generate_inputs(opt={"maxcycle": 100}, qm={"method": "dft", "charge": 0})
@@ -100,8 +112,20 @@ def test_default_qm_opt(generate_calcjob, generate_inputs):
     assert calc_info.retrieve_list == [
         ChemShellCalculation.FILE_STDOUT,
         ChemShellCalculation.FILE_RESULTS,
-        ChemShellCalculation.FILE_DLFIND,
     ]
+    assert calc_info.retrieve_temporary_list == [ChemShellCalculation.FILE_DLFIND]
+
+
+def test_qm_vibrational_analysis_retrieve_list(generate_calcjob, generate_inputs):
+    """Test the optimised structure file is not retrieved for a thermal analysis."""
+    inputs = generate_inputs(opt={"thermal": True}, qm={"method": "hf"})
+    _, calc_info = generate_calcjob(ChemShellCalculation, inputs)
+
+    assert calc_info.retrieve_list == [
+        ChemShellCalculation.FILE_STDOUT,
+        ChemShellCalculation.FILE_RESULTS,
+    ]
+    assert calc_info.retrieve_temporary_list == []
 
 
 def test_expanded_mm_parameters(generate_calcjob, generate_inputs):
@@ -5,6 +5,8 @@ from aiida.engine import run_get_node
 
 from aiida_chemshell.workflows.isolated_atoms import IsolatedAtomicEnergiesWorkChain
 
+pytestmark = pytest.mark.requires_chemshell
+
 
 @pytest.mark.xfail(reason="Will fail if NWChem not properly configured.")
 def test_geometry_optimisation_workflow(chemsh_code, get_test_data_file):
@@ -0,0 +1,144 @@
+"""Tests for parsing the outputs of ChemShell calculations."""
+
+import io
+import json
+
+import pytest
+from aiida.common.links import LinkType
+from aiida.orm import CalcJobNode, Dict, FolderData
+from aiida.plugins import ParserFactory
+
+from aiida_chemshell.calculations.base import ChemShellCalculation
+
+STDOUT = (
+    "Energy calculation finished, energy:  -76.0100\n"
+    "Energy calculation finished, energy:  -76.0200\n"
+)
+
+
+@pytest.fixture
+def generate_calcjob_node(get_test_data_file):
+    """Return a finished ChemShell CalcJobNode with the given retrieved files."""
+
+    def factory(
+        results: dict | None = None,
+        stdout: str = STDOUT,
+        optimisation_parameters: dict | None = None,
+    ) -> CalcJobNode:
+        node = CalcJobNode(process_type="aiida.calculations:chemshell")
+        node.set_option("resources", {"num_machines": 1})
+        inputs = {
+            "structure": get_test_data_file(),
+            "qm_parameters": Dict({"theory": "NWChem"}),
+        }
+        if optimisation_parameters is not None:
+            inputs["optimisation_parameters"] = Dict(optimisation_parameters)
+        for link_label, input_node in inputs.items():
+            input_node.store()
+            node.base.links.add_incoming(input_node, LinkType.INPUT_CALC, link_label)
+        node.store()
+
+        if results is None:
+            results = {"energy": [-76.02]}
+        retrieved = FolderData()
+        retrieved.put_object_from_filelike(
+            io.BytesIO(stdout.encode()), ChemShellCalculation.FILE_STDOUT
+        )
+        retrieved.put_object_from_filelike(
+            io.BytesIO(json.dumps(results).encode()),
+            ChemShellCalculation.FILE_RESULTS,
+        )
+        retrieved.base.links.add_incoming(node, LinkType.CREATE, "retrieved")
+        retrieved.store()
+        return node
+
+    return factory
+
+
+def test_opt_parser_retrieved_temporary_folder(tmp_path, generate_calcjob_node):
+    """Test the optimised structure is read from the retrieved temporary folder."""
+    structure_txt = '{"atoms": "optimised"}'
+    (tmp_path / ChemShellCalculation.FILE_DLFIND).write_text(structure_txt)
+
+    parser = ParserFactory("chemshell")
+    results, calcfunction = parser.parse_from_node(
+        generate_calcjob_node(optimisation_parameters={}),
+        store_provenance=False,
+        retrieved_temporary_folder=str(tmp_path),
+    )
+
+    assert calcfunction.exit_status == 0
+    assert results["energy"].value == -76.02
+    optimised_structure = results["optimised_structure"]
+    assert optimised_structure.filename == ChemShellCalculation.FILE_DLFIND
+    assert optimised_structure.get_content() == structure_txt
+    assert "(water.cjson)" in optimised_structure.description
+    energies = results["optimisation_path"].get_array("energies")
+    assert energies.tolist() == [-76.01, -76.02]
+
+
+def test_opt_parser_without_retrieved_temporary_folder(generate_calcjob_node):
+    """Test re-parsing an optimisation without its retrieved temporary folder."""
+    parser = ParserFactory("chemshell")
+    results, calcfunction = parser.parse_from_node(
+        generate_calcjob_node(optimisation_parameters={}), store_provenance=False
+    )
+
+    assert (
+        calcfunction.exit_status
+        == ChemShellCalculation.exit_codes.ERROR_MISSING_OPTIMISED_STRUCTURE_FILE.status
+    )
+    assert "optimised_structure" not in results
+
+
+@pytest.mark.parametrize("energy", [None, [], {"final": -76.02}, ["-76.02 Hartree"]])
+def test_parser_malformed_energy(generate_calcjob_node, energy):
+    """Test a missing or malformed final energy returns the expected exit code."""
+    results = {} if energy is None else {"energy": energy}
+    parser = ParserFactory("chemshell")
+    _, calcfunction = parser.parse_from_node(
+        generate_calcjob_node(results=results), store_provenance=False
+    )
+
+    assert (
+        calcfunction.exit_status
+        == ChemShellCalculation.exit_codes.ERROR_MISSING_FINAL_ENERGY.status
+    )
+
+
+def test_parser_vibrational_analysis(generate_calcjob_node):
+    """Test the thermochemistry is extracted from the analysis section of the log."""
+    stdout = (
+        STDOUT
+        + "Temperature: 999.00 K\n"
+        + "Thermochemical analysis\n"
+        + "Temperature: 298.15 K\n"
+        + "E_electronic correction (thermal) to the energy: 0.002832 Hartree\n"
+        + "Mode  Eigenvalue  Frequency  ZPE  E vib  S vib\n"
+        + "   1   0.0712   1595.12   0.003634   0.003634   0.000000\n"
+        + "   2   0.2144   3831.40   0.008728   0.008728   0.000000\n"
+        + "total ZPE 0.012362 Hartree\n"
+        + "total E vib 0.012362 Hartree\n"
+        + "total S vib 0.000001 Hartree/K\n"
+        + "Temperature: 500.00 K\n"
+    )
+    parser = ParserFactory("chemshell")
+    results, calcfunction = parser.parse_from_node(
+        generate_calcjob_node(stdout=stdout, optimisation_parameters={"thermal": True}),
+        store_provenance=False,
+    )
+
+    assert calcfunction.exit_status == 0
+    assert results["vibrational_energies"].get_dict() == {
+        "Temperature / K": 298.15,
+        "E_electronic correction / Hartree": 0.002832,
+        "ZPE / Hartree": 0.012362,
+        "Enthalpy / Hartree": 0.012362,
+        "Entropy / Hartree/K": 0.000001,
+    }
+    modes = results["vibrational_modes"].get_array("Modes")
+    assert modes.tolist() == [
+        [1595.12, 0.003634, 0.003634, 0.0],
+        [3831.40, 0.008728, 0.008728, 0.0],
+    ]
+    assert "optimised_structure" not in results
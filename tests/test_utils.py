@@ -0,0 +1,59 @@
+"""Tests for the aiida-chemshell utility functions."""
+
+from aiida.orm import StructureData
+
+from aiida_chemshell.utils import chemsh_punch_to_structure_data
+
+
+def test_punch_to_structure_data():
+    """Test conversion of a multi block ChemShell punch file to StructureData."""
+    water_dimer = [
+        ("O", (0.0, 0.0, 0.221665)),
+        ("H", (0.0, 1.430901, -0.886659)),
+        ("H", (0.0, -1.430901, -0.886659)),
+        ("O", (5.0, 0.0, 0.221665)),
+        ("H", (5.0, 1.430901, -0.886659)),
+        ("H", (5.0, -1.430901, -0.886659)),
+    ]
+    methane = [
+        ("C", (10.0, 0.0, 0.0)),
+        ("H", (11.0, 1.0, 1.0)),
+        ("H", (9.0, -1.0, 1.0)),
+        ("H", (9.0, 1.0, -1.0)),
+        ("H", (11.0, -1.0, -1.0)),
+    ]
+
+    def coordinates_block(atoms):
+        lines = [f"block = coordinates records = {len(atoms):d}"]
+        lines += [f"{symbol:s} {x:f} {y:f} {z:f}" for symbol, (x, y, z) in atoms]
+        return "\n".join(lines) + "\n"
+
+    punch = (
+        "block = fragment records = 0\n"
+        "block = title records = 1\n"
+        "water dimer and methane\n"
+        + coordinates_block([])
+        + coordinates_block(water_dimer)
+        + "block = connectivity records = 2\n1 2\n1 3\n"
+        + coordinates_block(methane)
+    )
+
+    expected = StructureData(pbc=[False, False, False])
+    for symbol, position in water_dimer + methane:
+        expected.append_atom(position=position, symbols=symbol)
+
+    structure = chemsh_punch_to_structure_data(punch)
+
+    assert len(structure.sites) == 11
+    assert structure.get_kind_names() == ["O", "H", "C"]
+    assert structure.base.attributes.all == expected.base.attributes.all
+
+
+def test_punch_to_structure_data_no_atoms():
+    """Test conversion of a ChemShell punch file without any atoms."""
+    punch = "block = title records = 1\nempty\nblock = coordinates records = 0\n"
+
+    structure = chemsh_punch_to_structure_data(punch)
+
+    expected = StructureData(pbc=[False, False, False])
+    assert structure.base.attributes.all == expected.base.attributes.all
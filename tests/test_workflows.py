@@ -1,9 +1,12 @@
 """Tests for carrying out pre-defined workflows with aiida-chemshell."""
 
+import pytest
 from aiida.engine import run_get_node
 
 from aiida_chemshell.workflows.optimisation import GeometryOptimisationWorkChain
 
+pytestmark = pytest.mark.requires_chemshell
+
 
 def test_geometry_optimisation_workflow(chemsh_code, get_test_data_file):
     """Test a geometry optimisation workflow with vibrational analysis."""